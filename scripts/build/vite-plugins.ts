@@ -0,0 +1,195 @@
+/**
+ * Vite Build Plugins
+ * 
+ * Post-processing for the build output. Vite bundles and minifies
+ * the application's JS and CSS itself; these plugins cover the files
+ * it copies verbatim from public/.
+ */
+
+import { createHash } from 'crypto';
+import { existsSync, readdirSync, readFileSync, rmSync, writeFileSync } from 'fs';
+import { extname, join, resolve } from 'path';
+import { brotliCompressSync, constants as zlibConstants, gzipSync } from 'zlib';
+import type { Plugin, ResolvedConfig } from 'vite';
+
+/**
+ * Recursively list the files under a directory
+ */
+function listFiles(dir: string): string[] {
+    const files: string[] = [];
+    for (const entry of readdirSync(dir, { withFileTypes: true })) {
+        const path = join(dir, entry.name);
+        if (entry.isDirectory()) {
+            files.push(...listFiles(path));
+        } else {
+            files.push(path);
+        }
+    }
+    return files;
+}
+
+/**
+ * Validate and minify the JSON configs copied from public/config.
+ * 
+ * The configs are pretty-printed for editing but fetched and parsed by
+ * the browser at runtime, so the indentation is pure payload. Each file
+ * is parsed once: a config that does not parse fails the build instead
+ * of failing in the browser, and the parsed value is what gets written
+ * back minified. Minification follows build.minify, like the rest of
+ * the bundle; validation always runs.
+ */
+export function minifyConfigJson(): Plugin {
+    let config: ResolvedConfig;
+
+    return {
+        name: 'datatables:minify-config-json',
+        apply: 'build',
+
+        configResolved(resolved) {
+            config = resolved;
+        },
+
+        writeBundle(options) {
+            const configDir = join(options.dir ?? resolve(config.root, config.build.outDir), 'config');
+            if (!existsSync(configDir)) return;
+
+            for (const file of listFiles(configDir)) {
+                if (!file.endsWith('.json')) continue;
+
+                let parsed: unknown;
+                try {
+                    parsed = JSON.parse(readFileSync(file, 'utf-8'));
+                } catch (error: any) {
+                    this.error(`Invalid JSON in ${file}: ${error.message}`);
+                }
+
+                if (config.build.minify) {
+                    writeFileSync(file, JSON.stringify(parsed), 'utf-8');
+                }
+            }
+        }
+    };
+}
+
+/**
+ * Add Subresource Integrity hashes to the script and stylesheet tags in index.html.
+ * 
+ * Vite already emits the JS and CSS as separate content-hashed files, so
+ * browsers cache them independently of index.html. The sha384 integrity
+ * attribute pins each tag to the exact bytes that were built, so a stale
+ * or tampered copy from a cache or proxy is rejected. Runs as the last
+ * generateBundle handler, after Vite has finished rewriting chunk code.
+ */
+export function subresourceIntegrity(): Plugin {
+    let config: ResolvedConfig;
+
+    return {
+        name: 'datatables:subresource-integrity',
+        apply: 'build',
+
+        configResolved(resolved) {
+            config = resolved;
+        },
+
+        generateBundle: {
+            order: 'post',
+            handler(_options, bundle) {
+                const integrityOf = (url: string): string | undefined => {
+                    if (!url.startsWith(config.base)) return undefined;
+
+                    const output = bundle[url.slice(config.base.length)];
+                    if (!output) return undefined;
+
+                    const source = output.type === 'chunk' ? output.code : output.source;
+                    return `sha384-${createHash('sha384').update(source).digest('base64')}`;
+                };
+
+                for (const output of Object.values(bundle)) {
+                    if (output.type !== 'asset' || !output.fileName.endsWith('.html')) continue;
+
+                    output.source = String(output.source).replace(/<(?:script|link)\b[^>]*>/g, tag => {
+                        if (tag.includes(' integrity=')) return tag;
+
+                        const url = /\s(?:src|href)="([^"]+)"/.exec(tag)?.[1];
+                        const integrity = url && integrityOf(url);
+                        if (!integrity) return tag;
+
+                        // SRI on module scripts and stylesheets requires a CORS request
+                        const crossorigin = /\scrossorigin\b/.test(tag) ? '' : ' crossorigin';
+                        return tag.replace(/(\s*\/)?>$/, ` integrity="${integrity}"${crossorigin}$1>`);
+                    });
+                }
+            }
+        }
+    };
+}
+
+/** Text formats worth serving pre-compressed */
+const COMPRESSIBLE_EXTENSIONS = new Set(['.html', '.js', '.css', '.json', '.svg', '.txt']);
+
+/** Files smaller than this are not worth a compressed sibling */
+const MIN_COMPRESS_SIZE = 1024;
+
+/**
+ * Remove compressed siblings left by an earlier build, so a server with
+ * gzip_static never serves them in place of the current file
+ */
+function removeSiblings(file: string): void {
+    rmSync(`${file}.gz`, { force: true });
+    rmSync(`${file}.br`, { force: true });
+}
+
+/**
+ * Write .gz and .br siblings next to every compressible file in the output.
+ * 
+ * Static servers that support pre-compressed files (nginx gzip_static,
+ * see nginx.conf) serve these directly instead of compressing each
+ * response, so the maximum compression levels cost nothing at runtime.
+ * Runs in closeBundle, after every other plugin has written its output.
+ */
+export function precompressAssets(): Plugin {
+    let config: ResolvedConfig;
+
+    return {
+        name: 'datatables:precompress-assets',
+        apply: 'build',
+
+        configResolved(resolved) {
+            config = resolved;
+        },
+
+        closeBundle() {
+            const outDir = resolve(config.root, config.build.outDir);
+            if (!existsSync(outDir)) return;
+
+            for (const file of listFiles(outDir)) {
+                if (!COMPRESSIBLE_EXTENSIONS.has(extname(file))) continue;
+
+                const content = readFileSync(file);
+                if (content.length < MIN_COMPRESS_SIZE) {
+                    removeSiblings(file);
+                    continue;
+                }
+
+                const gzipped = gzipSync(content, { level: 9 });
+                if (gzipped.length < content.length) {
+                    writeFileSync(`${file}.gz`, gzipped);
+                } else {
+                    rmSync(`${file}.gz`, { force: true });
+                }
+
+                const brotli = brotliCompressSync(content, {
+                    params: {
+                        [zlibConstants.BROTLI_PARAM_QUALITY]: zlibConstants.BROTLI_MAX_QUALITY,
+                        [zlibConstants.BROTLI_PARAM_SIZE_HINT]: content.length
+                    }
+                });
+                if (brotli.length < content.length) {
+                    writeFileSync(`${file}.br`, brotli);
+                } else {
+                    rmSync(`${file}.br`, { force: true });
+                }
+            }
+        }
+    };
+}
@@ -8,11 +8,10 @@
  * Example: npm run generate-config /data/mydb.db my-database-config
  */
 
-import { readFile, writeFile, mkdir } from 'fs/promises';
-import { existsSync, statSync } from 'fs';
+import { writeFile, mkdir } from 'fs/promises';
+import { existsSync } from 'fs';
 import { join, dirname, basename, extname } from 'path';
 import { fileURLToPath } from 'url';
-import Database from 'better-sqlite3';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -77,6 +76,8 @@ async function generateConfig(dbPath: string, configName: string): Promise<void>
     console.log(`\n📊 Analyzing database: ${dbPath}`);
     console.log(`📝 Generating config: ${configName}\n`);
 
+    // Load the native SQLite binding only once there is a database to open
+    const { default: Database } = await import('better-sqlite3');
     const db = new Database(dbPath, { readonly: true });
 
     try {
@@ -12,7 +12,7 @@
  *   echo '{"object_type":"...","config":{...}}' | node scripts/api-handler.js
  */
 
-import { readFileSync, existsSync } from 'fs';
+import { existsSync } from 'fs';
 import { spawn } from 'child_process';
 import { join, dirname } from 'path';
 import { fileURLToPath } from 'url';
@@ -23,8 +23,11 @@ const SAVE_SCRIPT = join(__dirname, '../config/save-config.ts');
 
 /**
  * Handle config save request
+ * 
+ * Takes the request body as received. Callers parse it only to reject
+ * malformed JSON, so it is piped to save-config without re-serializing.
  */
-async function handleConfigSave(configData: any): Promise<void> {
+async function handleConfigSave(body: string): Promise<void> {
     return new Promise((resolve, reject) => {
         // Use node with tsx loader from root node_modules
         const rootDir = join(__dirname, '../..');
@@ -32,8 +35,9 @@ async function handleConfigSave(configData: any): Promise<void> {
         const nodePath = process.execPath;
 
         // Try to use tsx from root, fallback to npx
-        const command = require('fs').existsSync(tsxPath) ? nodePath : 'npx';
-        const args = require('fs').existsSync(tsxPath)
+        const hasLocalTsx = existsSync(tsxPath);
+        const command = hasLocalTsx ? nodePath : 'npx';
+        const args = hasLocalTsx
             ? [tsxPath, SAVE_SCRIPT]
             : ['tsx', SAVE_SCRIPT];
 
@@ -42,7 +46,7 @@ async function handleConfigSave(configData: any): Promise<void> {
             cwd: rootDir, // Run from root to access node_modules
         });
 
-        child.stdin.write(JSON.stringify(configData));
+        child.stdin.write(body);
         child.stdin.end();
 
         let stdout = '';
@@ -89,8 +93,8 @@ async function main() {
 
                 req.on('end', async () => {
                     try {
-                        const configData = JSON.parse(body);
-                        await handleConfigSave(configData);
+                        JSON.parse(body);
+                        await handleConfigSave(body);
 
                         res.writeHead(200, { 'Content-Type': 'application/json' });
                         res.end(JSON.stringify({
@@ -125,8 +129,8 @@ async function main() {
         });
         process.stdin.on('end', async () => {
             try {
-                const configData = JSON.parse(input);
-                await handleConfigSave(configData);
+                JSON.parse(input);
+                await handleConfigSave(input);
                 process.exit(0);
             } catch (error: any) {
                 console.error(`Error: ${error.message}`);
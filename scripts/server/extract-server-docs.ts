@@ -2,42 +2,256 @@
  * Extract Server Documentation for TableScanner Prompts
  * 
  * Reads server/docs/*.md files and formats them for use in TableScanner prompts
+ * 
+ * Usage:
+ *   npm run extract-server-docs                       # print to stdout
+ *   npm run extract-server-docs -- --out <file>       # write to a file
+ *   npm run extract-server-docs -- --out <file> --force   # rebuild even if up to date
+ *   npm run extract-server-docs -- --out <file> --watch   # rebuild whenever a doc changes
  */
 
-import { readFile, readdir } from 'fs/promises';
-import { join, dirname } from 'path';
+import { open, readFile, readdir, rename, rm, stat, utimes, writeFile } from 'fs/promises';
+import { existsSync } from 'fs';
+import { createHash } from 'crypto';
+import { setTimeout as sleep } from 'timers/promises';
+import { join, dirname, basename } from 'path';
 import { fileURLToPath } from 'url';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 const SERVER_DOCS_DIR = join(__dirname, '../../server/docs');
 
-async function extractDocs(): Promise<string> {
+// Fixed fragments of the combined document, encoded once at import
+const DOCS_HEADER = Buffer.from(
+    '# DataTables Viewer Server API Documentation\n\n' +
+    'This documentation describes the integrated SQLite query service.\n\n' +
+    '---\n\n'
+);
+const DOC_SEPARATOR = Buffer.from('\n\n---\n\n');
+
+const WATCH_INTERVAL_MS = 200;
+
+/**
+ * List the paths of the markdown files in the docs directory, in output order
+ */
+async function listDocPaths(docsDir: string = SERVER_DOCS_DIR): Promise<string[]> {
+    const files = await readdir(docsDir);
+    return files
+        .filter(f => f.endsWith('.md'))
+        .sort()
+        .map(f => join(docsDir, f));
+}
+
+/**
+ * Read the server docs and return the combined document as ordered fragments.
+ * 
+ * Fragments stay as raw UTF-8 bytes all the way to the output, so the
+ * doc files are never decoded and re-encoded.
+ */
+async function collectDocParts(docPaths: string[]): Promise<Buffer[]> {
+    const parts: Buffer[] = [DOCS_HEADER];
+
+    // Reads are independent, so issue them together; results keep file order
+    const contents = await Promise.all(docPaths.map(path => readFile(path)));
+
+    for (const content of contents) {
+        parts.push(content);
+        parts.push(DOC_SEPARATOR);
+    }
+
+    return parts;
+}
+
+/**
+ * Hash the combined docs without joining the fragments
+ */
+function hashDocParts(parts: Buffer[]): string {
+    const hash = createHash('blake2b512');
+    for (const part of parts) {
+        hash.update(part);
+    }
+    return hash.digest('hex');
+}
+
+/**
+ * Path of the content-hash sidecar kept next to an output file
+ */
+function hashFileFor(outFile: string): string {
+    return join(dirname(outFile), `.${basename(outFile)}.sha`);
+}
+
+/**
+ * Write the combined docs without materializing them as a single buffer.
+ * File output hands every fragment to one scatter-gather writev call on a
+ * temp file, which is then renamed over the output. An interrupted write
+ * never leaves a partial output with a fresh mtime that isUpToDate()
+ * would accept, and the sidecar is only updated once the output is in place.
+ * 
+ * Unless forced, file output is skipped when its content hash matches the
+ * sidecar written by the previous run, which leaves the file's mtime
+ * untouched. The sidecar's mtime is refreshed instead, so isUpToDate()
+ * can still take the fast path on the next run.
+ */
+async function writeDocs(parts: Buffer[], outFile?: string, force = false): Promise<void> {
+    if (!outFile) {
+        for (const part of parts) {
+            process.stdout.write(part);
+        }
+        // Match the trailing newline console.log used to add
+        process.stdout.write('\n');
+        return;
+    }
+
+    const hashFile = hashFileFor(outFile);
+    const hash = hashDocParts(parts);
+    if (!force && existsSync(outFile) && existsSync(hashFile) && (await readFile(hashFile, 'utf-8')).trim() === hash) {
+        const now = new Date();
+        await utimes(hashFile, now, now);
+        console.log(`${outFile} unchanged, skipping write`);
+        return;
+    }
+
+    const tmpFile = `${outFile}.${process.pid}.tmp`;
+    const handle = await open(tmpFile, 'w');
     try {
-        const files = await readdir(SERVER_DOCS_DIR);
-        const mdFiles = files.filter(f => f.endsWith('.md')).sort();
+        try {
+            await handle.writev(parts);
+        } finally {
+            await handle.close();
+        }
+        await rename(tmpFile, outFile);
+    } catch (error) {
+        await rm(tmpFile, { force: true });
+        throw error;
+    }
 
-        let combined = '# DataTables Viewer Server API Documentation\n\n';
-        combined += 'This documentation describes the integrated SQLite query service.\n\n';
-        combined += '---\n\n';
+    await writeFile(hashFile, hash + '\n', 'utf-8');
+}
 
-        for (const file of mdFiles) {
-            const content = await readFile(join(SERVER_DOCS_DIR, file), 'utf-8');
-            combined += content + '\n\n---\n\n';
+/**
+ * Check whether the output is newer than every input: the script that
+ * builds it, the docs directory (so added or removed files count) and
+ * each doc file.
+ * 
+ * The output counts as fresh as of the later of its own mtime and its
+ * hash sidecar's, since a verified-unchanged rebuild only touches the sidecar.
+ */
+async function isUpToDate(
+    outFile: string,
+    docPaths: string[],
+    docsDir: string = SERVER_DOCS_DIR,
+    scriptFile: string = __filename
+): Promise<boolean> {
+    if (!existsSync(outFile)) return false;
+
+    const hashFile = hashFileFor(outFile);
+    const outputs = existsSync(hashFile) ? [outFile, hashFile] : [outFile];
+    const inputs = [scriptFile, docsDir, ...docPaths];
+
+    const [outputStats, inputStats] = await Promise.all([
+        Promise.all(outputs.map(p => stat(p))),
+        Promise.all(inputs.map(p => stat(p))),
+    ]);
+    const built = Math.max(...outputStats.map(s => s.mtimeMs));
+    const newest = Math.max(...inputStats.map(s => s.mtimeMs));
+
+    return built >= newest;
+}
+
+/**
+ * Build the combined docs once, honoring the mtime and content-hash
+ * guards unless forced
+ */
+async function buildDocs(
+    outFile?: string,
+    force = false,
+    docsDir: string = SERVER_DOCS_DIR,
+    scriptFile: string = __filename
+): Promise<void> {
+    const docPaths = await listDocPaths(docsDir);
+
+    if (outFile && !force && await isUpToDate(outFile, docPaths, docsDir, scriptFile)) {
+        console.log(`${outFile} is up to date`);
+        return;
+    }
+
+    await writeDocs(await collectDocParts(docPaths), outFile, force);
+}
+
+/**
+ * Summarize the inputs' mtimes, so a watcher can tell when anything changed
+ */
+async function snapshotInputs(docPaths: string[], docsDir: string = SERVER_DOCS_DIR): Promise<string> {
+    const inputs = [docsDir, ...docPaths];
+    const stats = await Promise.all(inputs.map(p => stat(p)));
+    return inputs.map((p, i) => `${p}:${stats[i].mtimeMs}`).join('\n');
+}
+
+/**
+ * Poll the inputs and rebuild when their mtimes change.
+ * 
+ * Keeping one process alive avoids paying interpreter startup for every
+ * rebuild, and idle intervals cost only a directory listing and stats.
+ */
+async function watchDocs(outFile: string, docsDir: string = SERVER_DOCS_DIR): Promise<never> {
+    console.log(`Watching ${docsDir} for changes...`);
+    let previous = await snapshotInputs(await listDocPaths(docsDir), docsDir);
+
+    for (;;) {
+        await sleep(WATCH_INTERVAL_MS);
+
+        try {
+            const docPaths = await listDocPaths(docsDir);
+            const current = await snapshotInputs(docPaths, docsDir);
+            if (current === previous) continue;
+
+            previous = current;
+            await writeDocs(await collectDocParts(docPaths), outFile);
+        } catch (error: any) {
+            // Files can disappear mid-edit; report and keep watching
+            if (!error?.code) throw error;
+            console.error('Error extracting docs:', error.message);
         }
+    }
+}
 
-        return combined;
-    } catch (error: any) {
-        console.error('Error extracting docs:', error);
-        return '';
+/**
+ * Main function
+ */
+async function main() {
+    const outIndex = process.argv.indexOf('--out');
+    const outFile = outIndex !== -1 ? process.argv[outIndex + 1] : undefined;
+    const force = process.argv.includes('--force');
+    const watch = process.argv.includes('--watch');
+
+    if (outIndex !== -1 && (!outFile || outFile.startsWith('--'))) {
+        console.error('Error: --out requires a file path');
+        process.exit(1);
+    }
+
+    if (watch && !outFile) {
+        console.error('Error: --watch requires --out <file>');
+        process.exit(1);
+    }
+
+    if (!existsSync(SERVER_DOCS_DIR)) {
+        console.error(`Error: Server docs directory not found: ${SERVER_DOCS_DIR}`);
+        process.exit(1);
+    }
+
+    await buildDocs(outFile, force);
+
+    if (watch && outFile) {
+        await watchDocs(outFile);
     }
 }
 
 // If run directly
 if (import.meta.url === `file://${process.argv[1]}`) {
-    extractDocs().then(docs => {
-        console.log(docs);
+    main().catch((error) => {
+        console.error('Error extracting docs:', error);
+        process.exit(1);
     });
 }
 
-export { extractDocs };
+export { buildDocs, snapshotInputs };
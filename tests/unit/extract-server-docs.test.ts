@@ -0,0 +1,215 @@
+/**
+ * extract-server-docs Unit Tests
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { mkdtempSync, mkdirSync, readFileSync, rmSync, statSync, utimesSync, writeFileSync, existsSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import { buildDocs, snapshotInputs } from '../../scripts/server/extract-server-docs';
+
+// Fixed timestamps (seconds) so mtime comparisons don't depend on test speed
+const BUILT_AT = new Date('2021-01-01T00:00:00Z').getTime() / 1000;
+const EDITED_AT = new Date('2022-01-01T00:00:00Z').getTime() / 1000;
+const CREATED_AT = new Date('2020-01-01T00:00:00Z').getTime() / 1000;
+
+describe('extract-server-docs', () => {
+    let root: string;
+    let docsDir: string;
+    let scriptFile: string;
+    let outFile: string;
+    let hashFile: string;
+    let logSpy: ReturnType<typeof vi.spyOn>;
+
+    const setMtime = (path: string, seconds: number) => utimesSync(path, seconds, seconds);
+
+    const writeDoc = (name: string, content: string) => {
+        const path = join(docsDir, name);
+        writeFileSync(path, content);
+        setMtime(path, CREATED_AT);
+        setMtime(docsDir, CREATED_AT);
+        return path;
+    };
+
+    // The real script's mtime is the checkout time, which would make every
+    // fixed timestamp look stale; a stand-in with a known mtime replaces it
+    const build = (force = false) => buildDocs(outFile, force, docsDir, scriptFile);
+
+    const markBuilt = () => {
+        setMtime(outFile, BUILT_AT);
+        setMtime(hashFile, BUILT_AT);
+    };
+
+    const logged = () => logSpy.mock.calls.map(call => String(call[0]));
+
+    beforeEach(() => {
+        root = mkdtempSync(join(tmpdir(), 'server-docs-'));
+        docsDir = join(root, 'docs');
+        mkdirSync(docsDir);
+        scriptFile = join(root, 'extract-server-docs.ts');
+        writeFileSync(scriptFile, '');
+        setMtime(scriptFile, CREATED_AT);
+        outFile = join(root, 'out.md');
+        hashFile = join(root, '.out.md.sha');
+
+        writeDoc('a.md', '# A\n');
+        writeDoc('b.md', '# B\n');
+
+        logSpy = vi.spyOn(console, 'log').mockImplementation(() => { });
+    });
+
+    afterEach(() => {
+        logSpy.mockRestore();
+        rmSync(root, { recursive: true, force: true });
+    });
+
+    describe('buildDocs()', () => {
+        it('should write the combined docs in file order with a hash sidecar', async () => {
+            await build();
+
+            const content = readFileSync(outFile, 'utf-8');
+            expect(content.startsWith('# DataTables Viewer Server API Documentation')).toBe(true);
+            expect(content.indexOf('# A')).toBeLessThan(content.indexOf('# B'));
+            expect(content.endsWith('# B\n\n\n---\n\n')).toBe(true);
+            expect(existsSync(hashFile)).toBe(true);
+        });
+
+        it('should skip the rebuild when nothing is newer than the output', async () => {
+            await build();
+            markBuilt();
+            logSpy.mockClear();
+
+            await build();
+
+            expect(logged()).toContain(`${outFile} is up to date`);
+            expect(statSync(outFile).mtimeMs).toBe(BUILT_AT * 1000);
+        });
+
+        it('should rebuild when a doc is newer than the output', async () => {
+            await build();
+            markBuilt();
+
+            // Editing a file leaves its directory's mtime alone
+            writeFileSync(join(docsDir, 'a.md'), '# A, revised\n');
+            setMtime(join(docsDir, 'a.md'), EDITED_AT);
+            logSpy.mockClear();
+
+            await build();
+
+            expect(logged()).not.toContain(`${outFile} is up to date`);
+            expect(readFileSync(outFile, 'utf-8')).toContain('# A, revised');
+        });
+
+        it('should rebuild when the docs directory is newer than the output', async () => {
+            await build();
+            markBuilt();
+
+            // An added doc can carry an old mtime (e.g. copied in); only the directory changes
+            writeDoc('c.md', '# C\n');
+            setMtime(docsDir, EDITED_AT);
+            logSpy.mockClear();
+
+            await build();
+
+            expect(logged()).not.toContain(`${outFile} is up to date`);
+            expect(readFileSync(outFile, 'utf-8')).toContain('# C');
+        });
+
+        it('should rebuild when the script is newer than the output', async () => {
+            await build();
+            markBuilt();
+            setMtime(scriptFile, EDITED_AT);
+            logSpy.mockClear();
+
+            await build();
+
+            expect(logged()).not.toContain(`${outFile} is up to date`);
+        });
+
+        it('should leave the output alone when a touched doc is unchanged, then stay up to date', async () => {
+            await build();
+            markBuilt();
+            setMtime(join(docsDir, 'a.md'), EDITED_AT);
+
+            await build();
+
+            expect(logged()).toContain(`${outFile} unchanged, skipping write`);
+            expect(statSync(outFile).mtimeMs).toBe(BUILT_AT * 1000);
+            expect(statSync(hashFile).mtimeMs).toBeGreaterThan(EDITED_AT * 1000);
+
+            logSpy.mockClear();
+            await build();
+
+            expect(logged()).toContain(`${outFile} is up to date`);
+        });
+
+        it('should restore an edited output when forced', async () => {
+            await build();
+            const expected = readFileSync(outFile, 'utf-8');
+
+            writeFileSync(outFile, 'X\n');
+            await build(true);
+
+            expect(readFileSync(outFile, 'utf-8')).toBe(expected);
+            expect(logged()).not.toContain(`${outFile} unchanged, skipping write`);
+        });
+
+        it('should keep the previous output intact when a write fails, and rebuild on the next run', async () => {
+            await build();
+            const previous = readFileSync(outFile, 'utf-8');
+            const previousHash = readFileSync(hashFile, 'utf-8');
+            markBuilt();
+
+            writeFileSync(join(docsDir, 'a.md'), '# A, revised\n');
+            setMtime(join(docsDir, 'a.md'), EDITED_AT);
+
+            // Occupy the temp path writeDocs() uses so the write fails before the rename
+            const tmpFile = `${outFile}.${process.pid}.tmp`;
+            mkdirSync(tmpFile);
+            await expect(build()).rejects.toThrow();
+            rmSync(tmpFile, { recursive: true });
+
+            expect(readFileSync(outFile, 'utf-8')).toBe(previous);
+            expect(readFileSync(hashFile, 'utf-8')).toBe(previousHash);
+            expect(statSync(outFile).mtimeMs).toBe(BUILT_AT * 1000);
+
+            await build();
+
+            expect(readFileSync(outFile, 'utf-8')).toContain('# A, revised');
+            expect(existsSync(tmpFile)).toBe(false);
+        });
+
+        it('should end stdout output with a newline', async () => {
+            const writeSpy = vi.spyOn(process.stdout, 'write').mockImplementation(() => true);
+
+            await buildDocs(undefined, false, docsDir, scriptFile);
+
+            const written = writeSpy.mock.calls.map(call => String(call[0])).join('');
+            writeSpy.mockRestore();
+            expect(written.endsWith('# B\n\n\n---\n\n\n')).toBe(true);
+        });
+    });
+
+    describe('snapshotInputs()', () => {
+        const docPaths = () => ['a.md', 'b.md'].map(f => join(docsDir, f));
+
+        it('should be stable while nothing changes', async () => {
+            const first = await snapshotInputs(docPaths(), docsDir);
+            expect(await snapshotInputs(docPaths(), docsDir)).toBe(first);
+        });
+
+        it('should change when a doc is touched', async () => {
+            const first = await snapshotInputs(docPaths(), docsDir);
+            setMtime(join(docsDir, 'b.md'), EDITED_AT);
+
+            expect(await snapshotInputs(docPaths(), docsDir)).not.toBe(first);
+        });
+
+        it('should change when a doc is added', async () => {
+            const first = await snapshotInputs(docPaths(), docsDir);
+            const added = writeDoc('c.md', '# C\n');
+
+            expect(await snapshotInputs([...docPaths(), added], docsDir)).not.toBe(first);
+        });
+    });
+});
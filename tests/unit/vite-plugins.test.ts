@@ -0,0 +1,209 @@
+/**
+ * Vite Build Plugins Unit Tests
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { createHash } from 'crypto';
+import { existsSync, mkdirSync, mkdtempSync, readFileSync, rmSync, writeFileSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import { brotliCompressSync, brotliDecompressSync, gunzipSync, gzipSync } from 'zlib';
+import {
+    minifyConfigJson,
+    precompressAssets,
+    subresourceIntegrity
+} from '../../scripts/build/vite-plugins';
+
+// Hooks are called directly with a minimal fake of Vite's resolved config and plugin context
+const asAny = (value: unknown) => value as any;
+
+const pluginContext = {
+    error: (message: string): never => {
+        throw new Error(message);
+    },
+    warn: () => { }
+};
+
+const sri = (source: string | Buffer) =>
+    `sha384-${createHash('sha384').update(source).digest('base64')}`;
+
+describe('subresourceIntegrity', () => {
+    const JS = 'console.log("main");';
+    const CSS = 'body{margin:0}';
+
+    const runPlugin = (html: string, base = '/') => {
+        const plugin = asAny(subresourceIntegrity());
+        plugin.configResolved({ base });
+
+        // Bundle file names are relative to outDir; base only prefixes the URLs
+        const bundle: Record<string, any> = {
+            'index.html': { type: 'asset', fileName: 'index.html', source: html },
+            'assets/main-abc.js': { type: 'chunk', fileName: 'assets/main-abc.js', code: JS },
+            'assets/main-def.css': { type: 'asset', fileName: 'assets/main-def.css', source: Buffer.from(CSS) }
+        };
+        plugin.generateBundle.handler.call(pluginContext, {}, bundle);
+        return String(bundle['index.html'].source);
+    };
+
+    it('should run after every other generateBundle handler', () => {
+        expect(asAny(subresourceIntegrity()).generateBundle.order).toBe('post');
+    });
+
+    it('should add integrity to bundled script and stylesheet tags', () => {
+        const html = runPlugin(
+            '<script type="module" crossorigin src="/assets/main-abc.js"></script>\n' +
+            '<link rel="stylesheet" crossorigin href="/assets/main-def.css">'
+        );
+
+        expect(html).toBe(
+            `<script type="module" crossorigin src="/assets/main-abc.js" integrity="${sri(JS)}"></script>\n` +
+            `<link rel="stylesheet" crossorigin href="/assets/main-def.css" integrity="${sri(CSS)}">`
+        );
+    });
+
+    it('should add crossorigin when the tag lacks it', () => {
+        const html = runPlugin('<link rel="stylesheet" href="/assets/main-def.css">');
+
+        expect(html).toBe(`<link rel="stylesheet" href="/assets/main-def.css" integrity="${sri(CSS)}" crossorigin>`);
+    });
+
+    it('should keep self-closing tags well formed', () => {
+        const html = runPlugin('<link rel="modulepreload" href="/assets/main-abc.js" />');
+
+        expect(html).toBe(`<link rel="modulepreload" href="/assets/main-abc.js" integrity="${sri(JS)}" crossorigin />`);
+    });
+
+    it('should resolve bundle files under a non-root base', () => {
+        const html = runPlugin('<script type="module" crossorigin src="/viewer/assets/main-abc.js"></script>', '/viewer/');
+
+        expect(html).toContain(`integrity="${sri(JS)}"`);
+    });
+
+    it('should leave external, public and already-hashed tags untouched', () => {
+        const tags = [
+            '<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.min.css">',
+            '<link rel="icon" type="image/svg+xml" href="/vite.svg" />',
+            '<script type="module" crossorigin src="/assets/main-abc.js" integrity="sha384-pinned"></script>',
+            '<script>window.inline = true;</script>'
+        ].join('\n');
+
+        expect(runPlugin(tags)).toBe(tags);
+    });
+});
+
+describe('build output plugins', () => {
+    let root: string;
+    let outDir: string;
+
+    beforeEach(() => {
+        root = mkdtempSync(join(tmpdir(), 'vite-plugins-'));
+        outDir = join(root, 'dist');
+        mkdirSync(join(outDir, 'config', 'schemas'), { recursive: true });
+    });
+
+    afterEach(() => {
+        rmSync(root, { recursive: true, force: true });
+    });
+
+    describe('minifyConfigJson', () => {
+        const PRETTY = JSON.stringify({ id: 'test', tables: { genes: { columns: [] } } }, null, 4);
+
+        const runPlugin = (minify: boolean | 'esbuild') => {
+            const plugin = asAny(minifyConfigJson());
+            plugin.configResolved({ root, build: { outDir: 'dist', minify } });
+            plugin.writeBundle.call(pluginContext, { dir: outDir });
+        };
+
+        it('should minify configs, including nested directories', () => {
+            writeFileSync(join(outDir, 'config', 'index.json'), PRETTY);
+            writeFileSync(join(outDir, 'config', 'schemas', 'config.schema.json'), PRETTY);
+
+            runPlugin('esbuild');
+
+            const minified = JSON.stringify(JSON.parse(PRETTY));
+            expect(readFileSync(join(outDir, 'config', 'index.json'), 'utf-8')).toBe(minified);
+            expect(readFileSync(join(outDir, 'config', 'schemas', 'config.schema.json'), 'utf-8')).toBe(minified);
+        });
+
+        it('should leave formatting alone when minify is off', () => {
+            writeFileSync(join(outDir, 'config', 'index.json'), PRETTY);
+
+            runPlugin(false);
+
+            expect(readFileSync(join(outDir, 'config', 'index.json'), 'utf-8')).toBe(PRETTY);
+        });
+
+        it('should fail the build on invalid JSON, naming the file', () => {
+            const bad = join(outDir, 'config', 'broken.json');
+            writeFileSync(bad, '{ "id": ');
+
+            expect(() => runPlugin(false)).toThrow(`Invalid JSON in ${bad}`);
+        });
+
+        it('should ignore non-JSON files', () => {
+            writeFileSync(join(outDir, 'config', 'README.txt'), 'not json');
+
+            expect(() => runPlugin('esbuild')).not.toThrow();
+        });
+    });
+
+    describe('precompressAssets', () => {
+        const LARGE = 'const value = "compressible";\n'.repeat(200);
+
+        const runPlugin = () => {
+            const plugin = asAny(precompressAssets());
+            plugin.configResolved({ root, build: { outDir: 'dist' } });
+            plugin.closeBundle();
+        };
+
+        it('should write .gz and .br siblings that decompress to the source', () => {
+            const file = join(outDir, 'main.js');
+            writeFileSync(file, LARGE);
+
+            runPlugin();
+
+            expect(gunzipSync(readFileSync(`${file}.gz`)).toString()).toBe(LARGE);
+            expect(brotliDecompressSync(readFileSync(`${file}.br`)).toString()).toBe(LARGE);
+        });
+
+        it('should skip small and non-text files', () => {
+            writeFileSync(join(outDir, 'small.js'), 'x');
+            writeFileSync(join(outDir, 'data.db'), LARGE);
+
+            runPlugin();
+
+            expect(existsSync(join(outDir, 'small.js.gz'))).toBe(false);
+            expect(existsSync(join(outDir, 'data.db.gz'))).toBe(false);
+        });
+
+        it('should remove stale siblings when a file is no longer compressed', () => {
+            const file = join(outDir, 'main.js');
+            writeFileSync(file, 'x');
+            writeFileSync(`${file}.gz`, 'stale');
+            writeFileSync(`${file}.br`, 'stale');
+
+            runPlugin();
+
+            expect(existsSync(`${file}.gz`)).toBe(false);
+            expect(existsSync(`${file}.br`)).toBe(false);
+        });
+
+        it('should remove stale siblings when compression does not shrink the file', () => {
+            // A fixed SHA-512 chain: the same bytes every run, with no redundancy to compress
+            const file = join(outDir, 'noise.txt');
+            const noise = Buffer.concat(
+                Array.from({ length: 64 }, (_, i) => createHash('sha512').update(`block-${i}`).digest())
+            );
+            expect(gzipSync(noise, { level: 9 }).length).toBeGreaterThanOrEqual(noise.length);
+            expect(brotliCompressSync(noise).length).toBeGreaterThanOrEqual(noise.length);
+            writeFileSync(file, noise);
+            writeFileSync(`${file}.gz`, 'stale');
+            writeFileSync(`${file}.br`, 'stale');
+
+            runPlugin();
+
+            expect(existsSync(`${file}.gz`)).toBe(false);
+            expect(existsSync(`${file}.br`)).toBe(false);
+        });
+    });
+});
@@ -7,11 +7,19 @@
 
 import { defineConfig } from 'vite';
 import { resolve } from 'path';
+import { minifyConfigJson, precompressAssets, subresourceIntegrity } from './scripts/build/vite-plugins';
 
 export default defineConfig({
     // Serve the public directory for static assets
     publicDir: 'public',
 
+    // Build output post-processing
+    plugins: [
+        minifyConfigJson(),
+        subresourceIntegrity(),
+        precompressAssets()
+    ],
+
     // Development server configuration
     server: {
         fs: {